@@ -4,16 +4,30 @@ Wispa - Fast local voice-to-text for macOS
 Hold Command+Option+Control to record, release to transcribe and inject text
 """
 
+import importlib.util
+import os
+import platform
+import shutil
 import subprocess
-import tempfile
+import sys
+import threading
 import time
-import wave
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+import ctranslate2
 import numpy as np
 import sounddevice as sd
+from AppKit import NSSound
 from faster_whisper import WhisperModel
 from pynput import keyboard
+from Quartz import (
+    CGEventCreateKeyboardEvent,
+    CGEventKeyboardSetUnicodeString,
+    CGEventPost,
+    CGEventSetFlags,
+    kCGHIDEventTap,
+)
 
 
 # ============================================================================
@@ -27,8 +41,11 @@ USE_CTRL = True  # Control key
 USE_SHIFT = False  # Shift key
 
 # Model settings
-MODEL_SIZE = "small"  # Options: "tiny", "base", "small", "medium", "large-v3"
+# Options: distil-small.en (English only), distil-large-v3, tiny, base, small,
+# medium, large-v3. Distil models need faster-whisper (MLX: distil-large-v3 only)
+MODEL_SIZE = "distil-small.en"
 LANGUAGE = "en"  # Language code (e.g., "en", "es", "fr") or None for auto-detect
+BACKEND = "auto"  # Options: "auto", "mlx", "whisper.cpp", "faster-whisper"
 
 # Audio feedback sounds (macOS system sounds)
 # Options: Tink, Pop, Basso, Blow, Bottle, Frog, Funk, Glass, Hero, Morse, Ping, Purr, Sosumi, Submarine
@@ -37,22 +54,241 @@ STOP_SOUND = "Pop"  # Sound when recording stops
 
 # ============================================================================
 
+# Where MLX model weights are cached between runs
+MLX_CACHE_DIR = Path.home() / ".cache" / "mlx-whisper"
 
-class Wispa:
-    def __init__(self, model_size="small", language="en"):
-        """Initialize Wispa with faster-whisper model."""
+# Where pre-quantized CTranslate2 models are cached between runs
+# Distil checkpoints published for MLX; other distil sizes load the full model
+MLX_DISTIL_REPOS = {
+    "distil-large-v3": "mlx-community/distil-whisper-large-v3",
+}
+
+CT2_CACHE_DIR = Path.home() / ".cache" / "wispa"
+CT2_MODEL_FILES = (
+    "model.bin",
+    "config.json",
+    "tokenizer.json",
+    "preprocessor_config.json",
+)
+
+
+def _performance_cores():
+    """Number of performance cores on Apple Silicon, else half the CPUs."""
+    if sys.platform == "darwin":
+        try:
+            result = subprocess.run(
+                ["sysctl", "-n", "hw.perflevel0.physicalcpu"],
+                capture_output=True,
+                text=True,
+                check=True,
+            )
+            return int(result.stdout)
+        except (OSError, subprocess.CalledProcessError, ValueError):
+            pass  # Intel Macs have no perflevel sysctls
+    return max(1, (os.cpu_count() or 8) // 2)
+
+
+class HoldHotKey(keyboard.HotKey):
+    """HotKey that also fires on_deactivate when the combination is released."""
+
+    def __init__(self, keys, on_activate, on_deactivate):
+        super().__init__(keys, on_activate)
+        # Own copy of the key state rather than relying on HotKey internals
+        self._hold_keys = frozenset(keys)
+        self._held = set()
+        self._on_deactivate = on_deactivate
+
+    def press(self, key):
+        if key in self._hold_keys:
+            self._held.add(key)
+        super().press(key)
+
+    def release(self, key):
+        was_active = self._held == self._hold_keys
+        self._held.discard(key)
+        super().release(key)
+        if was_active and key in self._hold_keys:
+            self._on_deactivate()
+
+
+class FasterWhisperBackend:
+    """CTranslate2 backend - runs on CPU only."""
+
+    name = "faster-whisper"
+
+    def __init__(self, model_size, language):
         self.language = language
 
-        print(f"Loading {model_size} model... (this may take a few seconds)")
+        # Current CTranslate2 CPU builds don't list int8_float16, so this
+        # normally falls back to int8; it is picked up if a build supports it
+        compute_type = "int8_float16"
+        if compute_type not in ctranslate2.get_supported_compute_types("cpu"):
+            compute_type = "int8"
+        print(f"Using {compute_type} compute type")
 
-        # Optimize for Apple Silicon M1
+        self.checkpoint = model_size
         self.model = WhisperModel(
+            self._converted_model(model_size),
+            device="cpu",  # CTranslate2 has no Metal/ANE backend
+            compute_type=compute_type,  # Fast quantized inference
+            cpu_threads=_performance_cores(),
+        )
+
+    def _converted_model(self, model_size):
+        """Return a local int8 snapshot of the model, converting it on first run.
+
+        Loading already-quantized weights skips both the hub check and the
+        int8 re-quantization on every launch. Falls back to the hub model if
+        the converter's dependencies (transformers, torch) aren't installed.
+        """
+        output_dir = CT2_CACHE_DIR / f"{model_size}-int8"
+        if all((output_dir / name).exists() for name in CT2_MODEL_FILES):
+            return str(output_dir)
+
+        # The converter needs transformers and torch, which are optional
+        if not all(importlib.util.find_spec(dep) for dep in ("transformers", "torch")):
+            print("Install transformers and torch to cache a pre-quantized model")
+            return model_size
+
+        print(f"Converting {model_size} to {output_dir} (first run only)...")
+        # Convert into a sibling directory and swap it in once complete, so an
+        # interrupted conversion never looks like a cached model
+        tmp_dir = output_dir.with_name(output_dir.name + ".tmp")
+        try:
+            from ctranslate2.converters import TransformersConverter
+
+            if model_size.startswith("distil-"):
+                source = f"distil-whisper/{model_size}"
+            else:
+                source = f"openai/whisper-{model_size}"
+            converter = TransformersConverter(
+                source,
+                copy_files=["tokenizer.json", "preprocessor_config.json"],
+            )
+            converter.convert(str(tmp_dir), quantization="int8", force=True)
+            shutil.rmtree(output_dir, ignore_errors=True)
+            os.replace(tmp_dir, output_dir)
+        except Exception as e:
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+            print(f"Conversion failed ({e}), using the hub model")
+            return model_size
+        return str(output_dir)
+
+    def transcribe(self, audio):
+        """Transcribe audio, returning the text."""
+        segments, _ = self.model.transcribe(
+            audio,
+            beam_size=1,  # Faster, less accurate beam search
+            language=self.language,  # Use configured language
+            vad_filter=False,  # Disable VAD to see if it's filtering everything
+            without_timestamps=True,  # Short dictation - skip timestamp tokens
+            condition_on_previous_text=False,  # No prompt carried between windows
+            temperature=0.0,  # Single float disables the temperature fallback loop
+            no_speech_threshold=0.6,
+        )
+        text = " ".join([segment.text.strip() for segment in segments])
+        return text
+
+
+class MLXBackend:
+    """MLX backend - runs encoder and decoder on the Apple Silicon GPU."""
+
+    name = "mlx-whisper"
+
+    def __init__(self, model_size, language):
+        import mlx_whisper
+        from huggingface_hub import snapshot_download
+        from huggingface_hub.utils import LocalEntryNotFoundError
+
+        self._mlx_whisper = mlx_whisper
+        self.language = language
+
+        if model_size in MLX_DISTIL_REPOS:
+            repo = MLX_DISTIL_REPOS[model_size]
+        else:
+            if model_size.startswith("distil-"):
+                model_size = model_size.removeprefix("distil-")
+                print(f"No MLX distil checkpoint, using full {model_size} instead")
+            repo = f"mlx-community/whisper-{model_size}-mlx"
+        self.checkpoint = repo
+        try:
+            # Warm start - weights already cached, skip the hub round-trip
+            self.model_path = snapshot_download(
+                repo, cache_dir=MLX_CACHE_DIR, local_files_only=True
+            )
+        except LocalEntryNotFoundError:
+            print(f"Downloading {repo}...")
+            self.model_path = snapshot_download(repo, cache_dir=MLX_CACHE_DIR)
+
+    def transcribe(self, audio):
+        """Transcribe audio, returning the text."""
+        result = self._mlx_whisper.transcribe(
+            audio,
+            path_or_hf_repo=self.model_path,
+            language=self.language,
+            without_timestamps=True,
+            condition_on_previous_text=False,
+            temperature=0.0,
+            no_speech_threshold=0.6,
+        )
+        return result["text"].strip()
+
+
+class WhisperCppBackend:
+    """whisper.cpp backend - Core ML encoder and Metal decoder."""
+
+    name = "whisper.cpp"
+
+    def __init__(self, model_size, language):
+        from pywhispercpp.model import Model
+
+        self.language = language
+
+        # Distil checkpoints aren't published as ggml, use the full model
+        if model_size.startswith("distil-"):
+            model_size = model_size.removeprefix("distil-")
+            print(f"No ggml distil checkpoint, using full {model_size} instead")
+
+        # English-only checkpoints are smaller and faster for English dictation
+        if language == "en" and model_size in ("tiny", "base", "small", "medium"):
+            model_size = f"{model_size}.en"
+        self.checkpoint = model_size
+
+        # Picks up ggml-<model>-encoder.mlmodelc next to the ggml weights
+        # when pywhispercpp is built with WHISPER_COREML=1
+        self.model = Model(
             model_size,
-            device="cpu",  # M1 uses CPU with Metal acceleration
-            compute_type="int8",  # Fast quantized inference
-            cpu_threads=4,  # Optimize for M1 performance cores
+            n_threads=_performance_cores(),
+            language=language or "auto",
+            no_timestamps=True,
+            no_context=True,
+            temperature=0.0,
+            temperature_inc=0.0,  # Disable the temperature fallback loop
+            print_progress=False,
+            print_realtime=False,
         )
 
+    def transcribe(self, audio):
+        """Transcribe audio, returning the text."""
+        segments = self.model.transcribe(audio)
+        return " ".join([segment.text.strip() for segment in segments])
+
+
+BACKENDS = {
+    "mlx": MLXBackend,
+    "whisper.cpp": WhisperCppBackend,
+    "faster-whisper": FasterWhisperBackend,
+}
+
+
+class Wispa:
+    def __init__(self, model_size="distil-small.en", language="en", backend="auto"):
+        """Initialize Wispa with the fastest available Whisper backend."""
+        self.language = language
+
+        if backend != "auto" and backend not in BACKENDS:
+            raise ValueError(f"Unknown backend: {backend}")
+
         # Build hotkey description
         keys = []
         if USE_CMD:
@@ -65,19 +301,101 @@ class Wispa:
             keys.append("Shift")
         hotkey_desc = "+".join(keys)
 
-        print("Model loaded! Ready to transcribe.")
         print(f"Hold {hotkey_desc} to record, release to transcribe.\n")
 
         # Recording state
         self.is_recording = False
-        self.audio_data = []
         self.sample_rate = 16000  # Whisper expects 16kHz
+        self._buf = np.empty(0, dtype=np.float32)
+        self._write_idx = 0
         self.stream = None
 
+        # Single worker keeps utterances in order without blocking the listener
+        self._pool = ThreadPoolExecutor(max_workers=1)
+        self._stopping = threading.Event()
+
+        # Feedback sounds are loaded once and played in-process
+        self._start_sound = NSSound.soundNamed_(START_SOUND)
+        self._stop_sound = NSSound.soundNamed_(STOP_SOUND)
+
+        # Load the model in the background so the hotkey works immediately;
+        # transcription waits on _model_ready if it is still loading
+        print(f"Loading model ({model_size} requested) in the background...")
+        self.model = None
+        self._load_error = None
+        self._model_ready = threading.Event()
+        threading.Thread(
+            target=self._load_model, args=(model_size, backend), daemon=True
+        ).start()
+
+    def _load_model(self, model_size, backend):
+        """Load and warm up the model, then signal _model_ready.
+
+        A load failure is kept in _load_error for run() to re-raise.
+        """
+        try:
+            model = self._select_backend(model_size, backend)
+            self.model = model
+            print(
+                f"Model loaded ({model.checkpoint} on {model.name})! "
+                "Ready to transcribe."
+            )
+        except Exception as e:
+            self._load_error = e
+        finally:
+            self._model_ready.set()
+
+    def _select_backend(self, model_size, backend):
+        """Load the requested backend, or the fastest one that works for "auto".
+
+        On Apple Silicon "auto" tries MLX-Whisper, then whisper.cpp, and
+        falls back to the CPU-only faster-whisper if they are missing or
+        fail to load. Errors from an explicitly chosen backend, or from the
+        final faster-whisper fallback, propagate and stop the app.
+        """
+        if backend != "auto":
+            return self._warm_up(BACKENDS[backend](model_size, self.language))
+
+        candidates = []
+        if platform.machine() == "arm64":
+            candidates = [MLXBackend, WhisperCppBackend]
+
+        for cls in candidates:
+            try:
+                return self._warm_up(cls(model_size, self.language))
+            except ImportError:
+                print(f"{cls.name} not installed, trying next backend")
+            except Exception as e:
+                print(f"{cls.name} failed to load ({e}), trying next backend")
+        return self._warm_up(FasterWhisperBackend(model_size, self.language))
+
+    def _warm_up(self, model):
+        """Run a pass on 1s of silence so the first real transcription isn't cold.
+
+        This also pages in kernels and BLAS, and surfaces lazy-load errors
+        (MLX reads its weights on first use) while fallback is still possible.
+        """
+        model.transcribe(np.zeros(self.sample_rate, dtype=np.float32))
+        return model
+
+    def _play(self, sound):
+        """Play a feedback sound, restarting it if it is still playing."""
+        if sound is None:
+            return
+        sound.stop()
+        sound.play()
+
     def start_recording(self):
         """Start recording audio."""
+        # Model failed to load - run() is about to exit, don't record
+        if self._load_error is not None:
+            return
+
         self.is_recording = True
-        self.audio_data = []
+
+        # Pre-allocate 60s of samples; chunks are written in place
+        self._buf = np.empty(self.sample_rate * 60, dtype=np.float32)
+        self._write_idx = 0
 
         print("[REC] Recording... (release key to transcribe)")
 
@@ -85,26 +403,30 @@ class Wispa:
             """Callback to capture audio chunks."""
             if status:
                 print(f"Audio status: {status}")
-            self.audio_data.append(indata.copy())
+            n = len(indata)
+            end = self._write_idx + n
+            if end > len(self._buf):
+                # Grow only on overflow (recordings longer than the buffer)
+                self._buf = np.resize(self._buf, max(end, 2 * len(self._buf)))
+            self._buf[self._write_idx : end] = indata[:, 0]
+            self._write_idx = end
 
         # Start audio stream FIRST, before the beep
         self.stream = sd.InputStream(
             samplerate=self.sample_rate,
             channels=1,
             dtype=np.float32,
+            blocksize=self.sample_rate // 10,  # Fixed 100ms chunks
+            latency="low",
             callback=audio_callback,
         )
         self.stream.start()
 
         # Audio feedback - play system beep (non-blocking)
-        subprocess.Popen(
-            ["afplay", f"/System/Library/Sounds/{START_SOUND}.aiff"],
-            stdout=subprocess.DEVNULL,
-            stderr=subprocess.DEVNULL,
-        )
+        self._play(self._start_sound)
 
     def stop_recording(self):
-        """Stop recording and transcribe."""
+        """Stop recording and queue the audio for transcription."""
         if not self.is_recording:
             return
 
@@ -115,174 +437,118 @@ class Wispa:
             self.stream.stop()
             self.stream.close()
 
-        # Audio feedback - different sound for stop
-        subprocess.run(
-            ["afplay", f"/System/Library/Sounds/{STOP_SOUND}.aiff"], check=False
-        )
-
-        print("[STOP] Stopped recording, transcribing...")
-
         # Process audio
-        if not self.audio_data:
+        audio = self._finalize_audio()
+        if audio is None:
             print("No audio recorded!")
             return
 
-        # Combine audio chunks
-        audio = np.concatenate(self.audio_data, axis=0).flatten()
-
         # Debug: show audio info
         duration = len(audio) / self.sample_rate
         max_amplitude = np.max(np.abs(audio))
         print(f"[DEBUG] Recorded {duration:.2f}s, max amplitude: {max_amplitude:.4f}")
 
-        # Save to temporary WAV file
-        with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as f:
-            temp_path = f.name
+        # Accidental tap or silence - skip the model (and the stop sound)
+        if duration < 0.3 or max_amplitude < 0.01:
+            print("[SKIP] silence")
+            return
+
+        # Audio feedback - different sound for stop
+        self._play(self._stop_sound)
 
-        try:
-            # Write WAV file
-            with wave.open(temp_path, "wb") as wf:
-                wf.setnchannels(1)
-                wf.setsampwidth(2)  # 16-bit
-                wf.setframerate(self.sample_rate)
-                # Convert float32 to int16
-                audio_int16 = (audio * 32767).astype(np.int16)
-                wf.writeframes(audio_int16.tobytes())
-
-            # Transcribe with faster-whisper
-            segments, info = self.model.transcribe(
-                temp_path,
-                beam_size=1,  # Faster, less accurate beam search
-                language=self.language,  # Use configured language
-                vad_filter=False,  # Disable VAD to see if it's filtering everything
-            )
+        print("[STOP] Stopped recording, transcribing...")
 
-            print(
-                f"[DEBUG] Language detected: {info.language}, probability: {info.language_probability:.2f}"
-            )
+        # Decode on the worker so the next hotkey press can start recording
+        self._pool.submit(self._transcribe_and_inject, audio)
+
+    def _finalize_audio(self):
+        """Hand off the recorded samples and reset the buffer for the next take."""
+        if not self._write_idx:
+            return None
+
+        # Recorded samples - models take float32 mono 16kHz samples directly
+        audio = self._buf[: self._write_idx]
+        self._buf = np.empty(0, dtype=np.float32)
+        self._write_idx = 0
+        return audio
+
+    def _transcribe_and_inject(self, audio):
+        """Transcribe audio and type the result (runs on the worker thread)."""
+        # Wait for the background load if the hotkey was used during startup
+        if not self._model_ready.is_set():
+            print("Waiting for model to finish loading...")
+        self._model_ready.wait()
+        if self._stopping.is_set() or self.model is None:
+            return  # Shutting down, or load failed and run() reports it
 
-            # Get transcription text
-            text = " ".join([segment.text.strip() for segment in segments])
+        try:
+            # Transcribe with the loaded backend
+            text = self.model.transcribe(audio)
+        except Exception as e:
+            # Futures swallow exceptions, so report them here
+            print(f"Transcription failed: {e}")
+            return
 
-            if text:
-                print(f" Transcribed: {text}")
-                self.inject_text(text)
-            else:
-                print("No speech detected!")
+        # Shutting down - an in-flight decode must not type into whatever has focus
+        if self._stopping.is_set():
+            return
 
-        finally:
-            # Clean up temp file
-            Path(temp_path).unlink(missing_ok=True)
+        if text:
+            print(f" Transcribed: {text}")
+            self.inject_text(text)
+        else:
+            print("No speech detected!")
 
     def inject_text(self, text):
-        """Inject text into focused input using AppleScript."""
+        """Inject text into focused input as synthetic Unicode key events."""
         # Add a space after the text for continuous dictation
         text_with_space = text + " "
 
-        # Escape special characters for AppleScript
-        escaped = text_with_space.replace("\\", "\\\\").replace('"', '\\"')
-
-        script = f'tell application "System Events" to keystroke "{escaped}"'
-
-        try:
-            subprocess.run(
-                ["osascript", "-e", script], check=True, capture_output=True, text=True
-            )
-        except subprocess.CalledProcessError as e:
-            print(f"Failed to inject text: {e.stderr}")
+        # Apps only read the first 20 UTF-16 units of each key event
+        units = text_with_space.encode("utf-16-le")
+        start = 0
+        while start < len(units):
+            end = min(start + 40, len(units))  # 20 units = 40 bytes
+            # Never split a surrogate pair across events
+            if end < len(units) and 0xD8 <= units[end - 1] <= 0xDB:
+                end -= 2
+            chunk = units[start:end].decode("utf-16-le")
+            for key_down in (True, False):
+                event = CGEventCreateKeyboardEvent(None, 0, key_down)
+                # Hotkey modifiers may still be held - type text, not shortcuts
+                CGEventSetFlags(event, 0)
+                CGEventKeyboardSetUnicodeString(event, (end - start) // 2, chunk)
+                CGEventPost(kCGHIDEventTap, event)
+            start = end
 
     def run(self):
         """Run the keyboard listener loop."""
         print("Wispa is running in the background...")
         print("Press Ctrl+C to exit.\n")
 
-        # Track key state for hold-to-record
-        cmd_pressed = False
-        option_pressed = False
-        ctrl_pressed = False
-        shift_pressed = False
-
-        def on_press(key):
-            nonlocal cmd_pressed, option_pressed, ctrl_pressed, shift_pressed
-
-            # Check for modifier keys
-            if (
-                key == keyboard.Key.cmd
-                or key == keyboard.Key.cmd_l
-                or key == keyboard.Key.cmd_r
-            ):
-                cmd_pressed = True
-            elif (
-                key == keyboard.Key.alt
-                or key == keyboard.Key.alt_l
-                or key == keyboard.Key.alt_r
-            ):
-                option_pressed = True
-            elif (
-                key == keyboard.Key.ctrl
-                or key == keyboard.Key.ctrl_l
-                or key == keyboard.Key.ctrl_r
-            ):
-                ctrl_pressed = True
-            elif (
-                key == keyboard.Key.shift
-                or key == keyboard.Key.shift_l
-                or key == keyboard.Key.shift_r
-            ):
-                shift_pressed = True
-
-            # Check if all required keys are pressed
-            all_pressed = (
-                (not USE_CMD or cmd_pressed)
-                and (not USE_OPTION or option_pressed)
-                and (not USE_CTRL or ctrl_pressed)
-                and (not USE_SHIFT or shift_pressed)
+        # Build the hotkey combination from the configured modifiers
+        modifiers = [
+            name
+            for name, used in (
+                ("<cmd>", USE_CMD),
+                ("<alt>", USE_OPTION),
+                ("<ctrl>", USE_CTRL),
+                ("<shift>", USE_SHIFT),
             )
+            if used
+        ]
+        hotkey = HoldHotKey(
+            keyboard.HotKey.parse("+".join(modifiers)),
+            on_activate=self.start_recording,
+            on_deactivate=self.stop_recording,
+        )
 
-            # Start recording when all required keys are pressed
-            if all_pressed and not self.is_recording:
-                self.start_recording()
+        # Left/right modifier variants are mapped to one key by canonical()
+        def on_press(key):
+            hotkey.press(listener.canonical(key))
 
         def on_release(key):
-            nonlocal cmd_pressed, option_pressed, ctrl_pressed, shift_pressed
-
-            # Track key releases
-            if (
-                key == keyboard.Key.cmd
-                or key == keyboard.Key.cmd_l
-                or key == keyboard.Key.cmd_r
-            ):
-                cmd_pressed = False
-            elif (
-                key == keyboard.Key.alt
-                or key == keyboard.Key.alt_l
-                or key == keyboard.Key.alt_r
-            ):
-                option_pressed = False
-            elif (
-                key == keyboard.Key.ctrl
-                or key == keyboard.Key.ctrl_l
-                or key == keyboard.Key.ctrl_r
-            ):
-                ctrl_pressed = False
-            elif (
-                key == keyboard.Key.shift
-                or key == keyboard.Key.shift_l
-                or key == keyboard.Key.shift_r
-            ):
-                shift_pressed = False
-
-            # Check if all required keys are still pressed
-            all_pressed = (
-                (not USE_CMD or cmd_pressed)
-                and (not USE_OPTION or option_pressed)
-                and (not USE_CTRL or ctrl_pressed)
-                and (not USE_SHIFT or shift_pressed)
-            )
-
-            # Stop recording when any required key is released
-            if self.is_recording and not all_pressed:
-                self.stop_recording()
+            hotkey.release(listener.canonical(key))
 
         # Start listener in a separate thread (non-blocking)
         listener = keyboard.Listener(on_press=on_press, on_release=on_release)
@@ -292,6 +558,8 @@ class Wispa:
             # Use a sleep loop instead of blocking join()
             # This allows keyboard interrupts to be caught promptly
             while listener.is_alive():
+                if self._load_error is not None:
+                    raise self._load_error
                 time.sleep(0.5)
         except KeyboardInterrupt:
             # Stop the listener on keyboard interrupt
@@ -301,11 +569,16 @@ class Wispa:
             # Ensure cleanup happens
             if listener.is_alive():
                 listener.stop()
+            # Running decodes can't be interrupted, so stop them injecting;
+            # releasing _model_ready frees a job still waiting on the load
+            self._stopping.set()
+            self._model_ready.set()
+            self._pool.shutdown(wait=False, cancel_futures=True)
 
 
 if __name__ == "__main__":
     try:
-        wispa = Wispa(model_size=MODEL_SIZE, language=LANGUAGE)
+        wispa = Wispa(model_size=MODEL_SIZE, language=LANGUAGE, backend=BACKEND)
         wispa.run()
     except KeyboardInterrupt:
         print("\n\nWispa stopped.")